@@ -1,40 +1,66 @@
 import logging
-import pandas as pd
 from pycoingecko import CoinGeckoAPI
-from typing import List
+from typing import List, Tuple
 import numpy as np
-from functools import lru_cache
+from scipy.signal import lfilter
+from threading import RLock
+from cachetools import TTLCache, cached
 from langchain.agents import tool
 
-# Setup basic logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-
 # Initialize CoinGecko API client
 cg = CoinGeckoAPI()
 
+# Short-lived caches for read endpoints; TTLs follow how quickly each dataset changes.
+# The cached helpers raise on failure, so errors are never stored.
+price_cache = TTLCache(maxsize=100, ttl=30)
+ohlc_cache = TTLCache(maxsize=100, ttl=300)
+market_chart_cache = TTLCache(maxsize=100, ttl=300)
+exchange_rates_cache = TTLCache(maxsize=1, ttl=60)
+trending_cache = TTLCache(maxsize=1, ttl=300)
+cache_lock = RLock()  # Flask serves requests from several threads
+
+@cached(price_cache, lock=cache_lock)
+def _get_price(ids: str, vs_currency: str) -> dict:
+    return cg.get_price(ids=ids, vs_currencies=vs_currency)
+
+@cached(ohlc_cache, lock=cache_lock)
+def _get_ohlc(coin_id: str, vs_currency: str, days: int) -> list:
+    return cg.get_coin_ohlc_by_id(id=coin_id, vs_currency=vs_currency, days=days)
+
+@cached(market_chart_cache, lock=cache_lock)
+def _get_market_chart(coin_id: str, vs_currency: str, days: int) -> dict:
+    return cg.get_coin_market_chart_by_id(id=coin_id, vs_currency=vs_currency, days=days)
+
+@cached(exchange_rates_cache, lock=cache_lock)
+def _get_exchange_rates() -> dict:
+    return cg.get_exchange_rates()
+
+@cached(trending_cache, lock=cache_lock)
+def _get_trending() -> dict:
+    return cg.get_search_trending()
+
 @tool
 def get_market_data(coin_ids: List[str], vs_currency: str = 'usd') -> str:
     """
     Fetches and returns current market data for specified cryptocurrencies.
     """
     try:
-        data = cg.get_price(ids=','.join(coin_ids), vs_currencies=vs_currency)
+        data = _get_price(','.join(sorted(coin_ids)), vs_currency)
         return str(data)
     except Exception as e:
-        logging.error(f"Exception occurred while fetching market data: {str(e)}")
+        logging.error("Exception occurred while fetching market data: %s", e)
         return "Failed to fetch market data."
 
 @tool
-@lru_cache(maxsize=100)
 def get_historical_market_data(coin_id: str, vs_currency: str = 'usd', days: int = 90) -> str:
     """
     Fetches historical market data for a specified cryptocurrency over a number of days.
     """
     try:
-        data = cg.get_coin_market_chart_by_id(id=coin_id, vs_currency=vs_currency, days=days)
+        data = _get_market_chart(coin_id, vs_currency, days)
         return str(data)
     except Exception as e:
-        logging.error(f"Exception occurred while fetching historical market data: {str(e)}")
+        logging.error("Exception occurred while fetching historical market data: %s", e)
         return "Failed to fetch historical market data."
 
 @tool
@@ -43,10 +69,10 @@ def get_ohlc(coin_id: str, vs_currency: str = 'usd', days: int = 1) -> str:
     Fetches OHLC (Open, High, Low, Close) data for a specified cryptocurrency for the last number of days.
     """
     try:
-        data = cg.get_coin_ohlc_by_id(id=coin_id, vs_currency=vs_currency, days=days)
+        data = _get_ohlc(coin_id, vs_currency, days)
         return str(data)
     except Exception as e:
-        logging.error(f"Exception occurred while fetching OHLC data: {str(e)}")
+        logging.error("Exception occurred while fetching OHLC data: %s", e)
         return "Failed to fetch OHLC data."
 
 @tool
@@ -55,38 +81,51 @@ def get_trending_cryptos() -> str:
     Retrieves the list of trending cryptocurrencies on CoinGecko.
     """
     try:
-        data = cg.get_search_trending()
+        data = _get_trending()
         trending_names = [item['item']['name'] for item in data['coins']]
         return ', '.join(trending_names)
     except Exception as e:
-        logging.error(f"Exception occurred while fetching trending cryptocurrencies: {str(e)}")
+        logging.error("Exception occurred while fetching trending cryptocurrencies: %s", e)
         return "Failed to fetch trending cryptocurrencies."
 
+def _ema(values: np.ndarray, span: int) -> np.ndarray:
+    """
+    Exponential moving average matching pandas' ewm(span=span, adjust=False).mean().
+    The recurrence ema[t] = alpha*x[t] + (1-alpha)*ema[t-1] is run as a first-order IIR filter.
+    """
+    alpha = 2. / (span + 1)
+    ema, _ = lfilter([alpha], [1., alpha - 1.], values, zi=[(1. - alpha) * values[0]])
+    return ema
+
+def _macd_values(prices_array: np.ndarray, slow: int, fast: int, signal: int) -> Tuple[float, float]:
+    """Returns the latest MACD and Signal Line values for a float64 price array."""
+    macd = _ema(prices_array, fast) - _ema(prices_array, slow)
+    signal_line = _ema(macd, signal)
+    return macd[-1], signal_line[-1]
+
+def _describe_macd(macd_value: float, signal_line_value: float) -> str:
+    """Builds the human-readable MACD summary returned by the tools."""
+    trend = "bullish" if macd_value > signal_line_value else "bearish"
+    return (
+        f"The Moving Average Convergence Divergence (MACD) is {macd_value:.2f}, "
+        f"and the Signal Line is {signal_line_value:.2f}. "
+        f"The current trend is {trend}. The MACD is a trend-following momentum indicator "
+        f"that shows the relationship between two moving averages of a security’s price. "
+        f"A MACD above the Signal Line suggests a bullish trend, indicating it might be a good time to consider buying. Conversely, "
+        f"a MACD below the Signal Line suggests a bearish trend, which might not be the best time to buy. "
+        "Always consult with a financial advisor or do further research before making investment decisions."
+    )
+
 @tool
 def calculate_macd(prices: List[float], slow: int = 26, fast: int = 12, signal: int = 9) -> str:
     """
     Calculates the Moving Average Convergence Divergence (MACD) for a series of prices.
     """
     try:
-        prices_series = pd.Series(prices)
-        ema_fast = prices_series.ewm(span=fast, adjust=False).mean()
-        ema_slow = prices_series.ewm(span=slow, adjust=False).mean()
-        macd = ema_fast - ema_slow
-        signal_line = macd.ewm(span=signal, adjust=False).mean()
-        macd_value = macd.iloc[-1]
-        signal_line_value = signal_line.iloc[-1]
-        trend = "bullish" if macd_value > signal_line_value else "bearish"
-        return (
-            f"The Moving Average Convergence Divergence (MACD) is {macd_value:.2f}, "
-            f"and the Signal Line is {signal_line_value:.2f}. "
-            f"The current trend is {trend}. The MACD is a trend-following momentum indicator "
-            f"that shows the relationship between two moving averages of a security’s price. "
-            f"A MACD above the Signal Line suggests a bullish trend, indicating it might be a good time to consider buying. Conversely, "
-            f"a MACD below the Signal Line suggests a bearish trend, which might not be the best time to buy. "
-            "Always consult with a financial advisor or do further research before making investment decisions."
-        )
+        prices_array = np.asarray(prices, dtype=np.float64)
+        return _describe_macd(*_macd_values(prices_array, slow, fast, signal))
     except Exception as e:
-        logging.error(f"Exception occurred while calculating MACD: {str(e)}")
+        logging.error("Exception occurred while calculating MACD: %s", e)
         return "Failed to calculate MACD."
 
 @tool
@@ -95,42 +134,62 @@ def get_exchange_rates(coin_id: str = 'bitcoin') -> str:
     Retrieves exchange rates for a given coin (default is Bitcoin) to all other currencies.
     """
     try:
-        data = cg.get_exchange_rates()
+        data = _get_exchange_rates()
         rates = data['rates']
         base_rate = rates[coin_id]['value']
         exchange_rates = {cur: rate['value'] / base_rate for cur, rate in rates.items()}
         return str(exchange_rates)
     except Exception as e:
-        logging.error(f"Exception occurred while fetching exchange rates: {str(e)}")
+        logging.error("Exception occurred while fetching exchange rates: %s", e)
         return "Failed to fetch exchange rates."
 
+def _wilder_average(initial: float, values: np.ndarray, period: int) -> float:
+    """
+    Returns the final value of Wilder's smoothing seeded with `initial` over `values`.
+    The recurrence avg = (avg*(period-1) + value)/period unrolls to a weighted sum,
+    so it is evaluated as one dot product instead of a Python loop.
+    """
+    decay = (period - 1) / period
+    weights = decay ** np.arange(len(values) - 1, -1, -1)
+    return initial * decay ** len(values) + (weights @ values) / period
+
+def _rsi_value(prices_array: np.ndarray, period: int) -> float:
+    """Returns the latest RSI value for a float64 price array."""
+    deltas = np.diff(prices_array)
+    seed = deltas[:period+1]
+    up = seed[seed >= 0].sum()/period
+    down = -seed[seed < 0].sum()/period
+
+    # Smooth the remaining moves; only the latest RSI value is reported
+    moves = deltas[period-1:]
+    up = _wilder_average(up, np.where(moves > 0, moves, 0.), period)
+    down = _wilder_average(down, np.where(moves < 0, -moves, 0.), period)
+
+    rs = up/down
+    return 100. - 100./(1.+rs)
+
 @tool
 def calculate_rsi(prices: List[float], period: int = 14) -> str:
     """
     Calculates the Relative Strength Index (RSI) for a given series of prices.
     """
     try:
-        prices_array = np.array(prices)
-        deltas = np.diff(prices_array)
-        seed = deltas[:period+1]
-        up = seed[seed >= 0].sum()/period
-        down = -seed[seed < 0].sum()/period
-        rs = up/down
-        rsi = np.zeros_like(prices_array)
-        rsi[:period] = 100. - 100./(1.+rs)
-
-        for i in range(period, len(prices_array)):
-            delta = deltas[i-1]
-            upval = delta if delta > 0 else 0.
-            downval = -delta if delta < 0 else 0.
-
-            up = (up*(period-1) + upval)/period
-            down = (down*(period-1) + downval)/period
-
-            rs = up/down
-            rsi[i] = 100. - 100./(1.+rs)
-
-        return f"RSI: {rsi[-1]:.2f}"
+        prices_array = np.asarray(prices, dtype=np.float64)
+        return f"RSI: {_rsi_value(prices_array, period):.2f}"
     except Exception as e:
-        logging.error(f"Exception occurred while calculating RSI: {str(e)}")
+        logging.error("Exception occurred while calculating RSI: %s", e)
         return "Failed to calculate RSI."
+
+@tool
+def calculate_indicators(prices: List[float], period: int = 14, slow: int = 26, fast: int = 12, signal: int = 9) -> str:
+    """
+    Calculates both the RSI and the MACD for a series of prices in one call.
+    Prefer this over calling calculate_rsi and calculate_macd separately on the same prices.
+    """
+    try:
+        prices_array = np.asarray(prices, dtype=np.float64)
+        rsi = _rsi_value(prices_array, period)
+        return f"RSI: {rsi:.2f}. " + _describe_macd(*_macd_values(prices_array, slow, fast, signal))
+    except Exception as e:
+        logging.error("Exception occurred while calculating indicators: %s", e)
+        return "Failed to calculate indicators."
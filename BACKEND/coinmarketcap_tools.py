@@ -1,5 +1,8 @@
 import os
-from requests import Session, ConnectionError, Timeout, TooManyRedirects
+import threading
+from requests import Session, ConnectionError, HTTPError, Timeout, TooManyRedirects
+from cachetools import TTLCache, cachedmethod
+from cachetools.keys import hashkey
 from langchain.tools import tool
 
 # Load API key from environment variable
@@ -7,6 +10,10 @@ API_KEY = os.getenv('CMC_PRO_API_KEY')
 if not API_KEY:
     raise ValueError("Please set the 'CMC_PRO_API_KEY' environment variable.")
 
+def _request_key(endpoint, parameters):
+    # Tool arguments may arrive as lists, so key on their repr rather than the raw values
+    return hashkey(endpoint, *sorted((name, repr(value)) for name, value in parameters.items()))
+
 class CoinMarketCapAPI:
     def __init__(self):
         self.api_key = API_KEY
@@ -17,13 +24,24 @@ class CoinMarketCapAPI:
         }
         self.session = Session()
         self.session.headers.update(self.headers)
+        # Listings and global metrics refresh every few minutes; avoid spending API credits on repeats
+        self.cache = TTLCache(maxsize=100, ttl=300)
+        self.cache_lock = threading.Lock()
+
+    @cachedmethod(lambda self: self.cache, key=lambda self, endpoint, parameters: _request_key(endpoint, parameters),
+                  lock=lambda self: self.cache_lock)
+    def _fetch(self, endpoint, parameters):
+        """GET an endpoint and parse the body; raises on failure so only successful responses are cached."""
+        response = self.session.get(f"{self.base_url}/{endpoint}", params=parameters)
+        response.raise_for_status()
+        return response.json()
 
     def make_request(self, endpoint, parameters):
         try:
-            url = f"{self.base_url}/{endpoint}"
-            response = self.session.get(url, params=parameters)
-            data = response.json()
-            return data
+            return self._fetch(endpoint, parameters)
+        except HTTPError as e:
+            # Error bodies carry CoinMarketCap's status message; pass them through uncached
+            return e.response.json()
         except (ConnectionError, Timeout, TooManyRedirects) as e:
             print(f"Error fetching data from CoinMarketCap: {e}")
             return None
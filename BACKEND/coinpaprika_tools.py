@@ -5,6 +5,10 @@ from langchain.agents import tool  # Use the @tool decorator
 # Define a robust cache to manage API rate limits
 cache = TTLCache(maxsize=100, ttl=600)
 
+# Reuse one connection pool for all CoinPaprika requests
+session = requests.Session()
+session.headers.update({"User-Agent": "coinpaprika/python"})
+
 class APIError(Exception):
     """Exception class for API errors"""
     def __init__(self, status, message):
@@ -14,9 +18,8 @@ class APIError(Exception):
 
 def safe_request(url, params=None):
     """Safely perform HTTP requests and handle common errors."""
-    headers = {"User-Agent": "coinpaprika/python"}
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        response = session.get(url, params=params, timeout=10)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.HTTPError as e:
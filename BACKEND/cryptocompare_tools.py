@@ -1,110 +1,117 @@
 import os
+import threading
 import requests
+import orjson
 import json
+from typing import List
+from cachetools import TTLCache, cached
+from dotenv import load_dotenv
+from http_client import RateLimitedSession
 from langchain.agents import tool  # Use the @tool decorator for Langchain compatibility
 
+# Load environment variables from .env file
+load_dotenv()
+
+BASE_URL = "https://min-api.cryptocompare.com/data"
+NEWS_FEEDS_URL = f"{BASE_URL}/news/feedsandcategories"
+
+# Resolve the API key once at import instead of on every tool call
+API_KEY = os.getenv('CRYPTOCOMPARE_API_KEY')
+HEADERS = {'authorization': f'Apikey {API_KEY}'} if API_KEY else {}
+
+# One connection pool for all CryptoCompare requests, bounded so bursts from parallel chat sessions stay under its rate limit
+client = RateLimitedSession()
+
 class APIError(Exception):
     """Custom API Error to handle exceptions from CryptoCompare requests."""
     def __init__(self, status_code, detail):
         super().__init__(f"API Error {status_code}: {detail}")
 
-@tool
-def get_current_price(symbol: str, currencies: str = 'USD') -> str:
-    """Fetches the current price of a specified cryptocurrency in one or more currencies."""
-    api_key = os.getenv('CRYPTOCOMPARE_API_KEY')
-    headers = {'authorization': f'Apikey {api_key}'} if api_key else {}
-    url = f"https://min-api.cryptocompare.com/data/price?fsym={symbol}&tsyms={currencies}"
+def _get_json(url, params=None):
+    """GET a CryptoCompare endpoint and parse its JSON body, raising APIError on any failure."""
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return f"Current prices for {symbol}: {response.json()}"
+        response = client.get(url, params=params, headers=HEADERS)
     except requests.RequestException as e:
+        # Connection errors and timeouts leave no response to take a status code from
+        raise APIError(None, str(e))
+    try:
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
         raise APIError(response.status_code, str(e))
 
+@tool
+def get_current_price(symbol: str, currencies: str = 'USD') -> str:
+    """Fetches the current price of a specified cryptocurrency in one or more currencies."""
+    url = f"{BASE_URL}/price"
+    params = {'fsym': symbol, 'tsyms': currencies}
+    return f"Current prices for {symbol}: {_get_json(url, params)}"
+
+@tool
+def get_current_prices(symbols: List[str], currencies: str = 'USD') -> str:
+    """Fetches the current prices of several cryptocurrencies in one request. Prefer this over repeated get_current_price calls."""
+    url = f"{BASE_URL}/pricemulti"
+    params = {'fsyms': ','.join(symbols), 'tsyms': currencies}
+    return f"Current prices for {', '.join(symbols)}: {_get_json(url, params)}"
+
 @tool
 def get_latest_social_stats(coin_symbol: str) -> str:
     """Retrieves the latest social statistics for a given cryptocurrency symbol."""
-    api_key = os.getenv('CRYPTOCOMPARE_API_KEY')
-    headers = {'authorization': f'Apikey {api_key}'} if api_key else {}
-    url = f"https://min-api.cryptocompare.com/data/social/coin/latest?fsym={coin_symbol}"
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        data = response.json()
-        coin_url = f"https://www.cryptocompare.com/coins/{coin_symbol}/overview"
-        return f"Latest social stats for {coin_symbol}: {data}. More details at: {coin_url}"
-    except requests.RequestException as e:
-        raise APIError(response.status_code, str(e))
+    url = f"{BASE_URL}/social/coin/latest"
+    params = {'fsym': coin_symbol}
+    data = _get_json(url, params)
+    coin_url = f"https://www.cryptocompare.com/coins/{coin_symbol}/overview"
+    return f"Latest social stats for {coin_symbol}: {data}. More details at: {coin_url}"
 
 @tool
 def get_historical_social_stats(coin_symbol: str, days: int = 30) -> str:
     """Fetches historical social data for a given cryptocurrency over a specified number of days."""
-    api_key = os.getenv('CRYPTOCOMPARE_API_KEY')
-    headers = {'authorization': f'Apikey {api_key}'} if api_key else {}
-    url = f"https://min-api.cryptocompare.com/data/social/coin/histo/day?fsym={coin_symbol}&limit={days}"
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        data = response.json()
-        coin_url = f"https://www.cryptocompare.com/coins/{coin_symbol}/overview"
-        return f"Historical social stats for {coin_symbol} over the last {days} days: {data}. More details at: {coin_url}"
-    except requests.RequestException as e:
-        raise APIError(response.status_code, str(e))
+    url = f"{BASE_URL}/social/coin/histo/day"
+    params = {'fsym': coin_symbol, 'limit': days}
+    data = _get_json(url, params)
+    coin_url = f"https://www.cryptocompare.com/coins/{coin_symbol}/overview"
+    return f"Historical social stats for {coin_symbol} over the last {days} days: {data}. More details at: {coin_url}"
+
 
+# The feed list changes rarely; keep it for five minutes. Failures raise, so they are never cached.
+news_feeds_cache = TTLCache(maxsize=1, ttl=300)
+
+@cached(news_feeds_cache, lock=threading.Lock())
+def _get_news_feeds_and_categories() -> dict:
+    """Fetch and parse the CryptoCompare news feeds and categories."""
+    return _get_json(NEWS_FEEDS_URL)
 
 @tool
 def list_news_feeds_and_categories() -> str:
     """Lists all news feeds and categories available from CryptoCompare."""
-    api_key = os.getenv('CRYPTOCOMPARE_API_KEY')
-    headers = {'authorization': f'Apikey {api_key}'} if api_key else {}
-    url = "https://min-api.cryptocompare.com/data/news/feedsandcategories"
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return f"News feeds and categories: {response.json()}. More details at: <a href='{url}'>CryptoCompare News</a>"
-    except requests.RequestException as e:
-        raise APIError(response.status_code, str(e))
+    data = _get_news_feeds_and_categories()
+    return f"News feeds and categories: {data}. More details at: <a href='{NEWS_FEEDS_URL}'>CryptoCompare News</a>"
     
     
 
 @tool
 def get_latest_trading_signals(coin_symbol: str) -> str:
     """Fetches the latest trading signals for a specified cryptocurrency symbol."""
-    api_key = os.getenv('CRYPTOCOMPARE_API_KEY')
-    headers = {'authorization': f'Apikey {api_key}'} if api_key else {}
-    url = f"https://min-api.cryptocompare.com/data/tradingsignals/intotheblock/latest?fsym={coin_symbol}"
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        data = response.json()
-        coin_url = f"https://www.cryptocompare.com/coins/{coin_symbol}/overview"
-        return f"Latest trading signals for {coin_symbol}: {data}. More details at: {coin_url}"
-    except requests.RequestException as e:
-        raise APIError(response.status_code, str(e))
+    url = f"{BASE_URL}/tradingsignals/intotheblock/latest"
+    params = {'fsym': coin_symbol}
+    data = _get_json(url, params)
+    coin_url = f"https://www.cryptocompare.com/coins/{coin_symbol}/overview"
+    return f"Latest trading signals for {coin_symbol}: {data}. More details at: {coin_url}"
 
 @tool
 def get_top_exchanges_by_volume(fsym: str, tsym: str, limit: int = 10) -> str:
     """Fetches top exchanges by volume for a specific trading pair."""
-    api_key = os.getenv('CRYPTOCOMPARE_API_KEY')
-    headers = {'authorization': f'Apikey {api_key}'} if api_key else {}
-    url = f"https://min-api.cryptocompare.com/data/top/exchanges?fsym={fsym}&tsym={tsym}&limit={limit}"
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return f"Top exchanges by volume for {fsym}/{tsym}: {response.json()}"
-    except requests.RequestException as e:
-        raise APIError(response.status_code, str(e))
+    url = f"{BASE_URL}/top/exchanges"
+    params = {'fsym': fsym, 'tsym': tsym, 'limit': limit}
+    return f"Top exchanges by volume for {fsym}/{tsym}: {_get_json(url, params)}"
 
 @tool
 def get_historical_daily(symbol: str, currency: str = 'USD', limit: int = 30) -> str:
     """Retrieves the daily historical data for a specific cryptocurrency in a given currency."""
-    api_key = os.getenv('CRYPTOCOMPARE_API_KEY')
-    headers = {'authorization': f'Apikey {api_key}'} if api_key else {}
-    url = f"https://min-api.cryptocompare.com/data/v2/histoday?fsym={symbol}&tsym={currency}&limit={limit}"
+    url = f"{BASE_URL}/v2/histoday"
+    params = {'fsym': symbol, 'tsym': currency, 'limit': limit}
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        data = response.json()
+        data = _get_json(url, params)
         if 'Data' not in data or 'Data' not in data['Data']:
             raise KeyError("Missing 'Data' key in the response.")
         historical_data = data['Data']['Data']
@@ -112,8 +119,6 @@ def get_historical_daily(symbol: str, currency: str = 'USD', limit: int = 30) ->
         return f"Historical daily data for {symbol} to {currency}: {historical_data}. More details at: {coin_url}"
     except KeyError as e:
         return f"Error: {str(e)}. Unable to retrieve historical daily data for {symbol}."
-    except requests.RequestException as e:
-        raise APIError(response.status_code, str(e))
 
 @tool
 def get_top_volume_symbols(currency: str = 'USD', limit: int = 10, page: int = 0) -> str:
@@ -126,14 +131,11 @@ def get_top_volume_symbols(currency: str = 'USD', limit: int = 10, page: int = 0
     Returns:
         str: List of top cryptocurrencies by volume.
     """
-    api_key = os.getenv('CRYPTOCOMPARE_API_KEY')
-    headers = {'authorization': f'Apikey {api_key}'} if api_key else {}
-    url = f"https://min-api.cryptocompare.com/data/top/totalvolfull?tsym={currency}&limit={limit}&page={page}"
+    url = f"{BASE_URL}/top/totalvolfull"
+    params = {'tsym': currency, 'limit': limit, 'page': page}
     
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        data = response.json()
+        data = _get_json(url, params)
 
         # Debug logging of the full response
         print(json.dumps(data, indent=4))
@@ -146,7 +148,5 @@ def get_top_volume_symbols(currency: str = 'USD', limit: int = 10, page: int = 0
     except KeyError as e:
         print(f"Error: Missing expected data in the response: {str(e)}")
         return f"Error: Missing expected data in the response: {str(e)}"
-    except requests.RequestException as e:
-        raise APIError(response.status_code, str(e))
 
 
@@ -1,29 +1,54 @@
 import os
-import requests
+import threading
+import orjson
+from cachetools import TTLCache
 from dotenv import load_dotenv
+from http_client import RateLimitedSession
 from langchain.agents import tool
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Resolve the API key and the posts feed URL once at import instead of on every tool call
+API_KEY = os.getenv('CRYPTOPANIC_API_KEY')
+NEWS_URL = f'https://cryptopanic.com/api/v1/posts/?auth_token={API_KEY}&public=true'
+
+# Shared CryptoPanic connection pool; cache misses from parallel chat sessions are capped by its slots
+client = RateLimitedSession()
+
+# All three news tools read the same posts feed; share one response between them for a minute
+news_cache = TTLCache(maxsize=4, ttl=60)
+news_cache_lock = threading.Lock()
+
+def _fetch_news(url):
+    """Return (status_code, parsed posts), serving successful responses from the shared cache."""
+    with news_cache_lock:
+        news = news_cache.get(url)
+    if news is not None:
+        return 200, news
+    response = client.get(url)
+    if response.status_code != 200:
+        return response.status_code, None
+    news = orjson.loads(response.content)
+    with news_cache_lock:
+        news_cache[url] = news
+    return 200, news
+
 @tool
 def get_latest_news() -> str:
     """
     Fetches the latest news from CryptoPanic.
     """
-    api_key = os.getenv('CRYPTOPANIC_API_KEY')
-    if not api_key:
+    if not API_KEY:
         return "API key for CryptoPanic not found. Please set it in the environment variables."
 
-    url = f'https://cryptopanic.com/api/v1/posts/?auth_token={api_key}&public=true'
     try:
-        response = requests.get(url)
-        if response.status_code == 200:
-            news = response.json()
+        status_code, news = _fetch_news(NEWS_URL)
+        if status_code == 200:
             news_titles = [f"{item['title']} - <a href='{item['url']}'>{item['url']}</a>" for item in news['results']]
             return '<br>'.join(news_titles)
         else:
-            return f"Failed to fetch news: {response.status_code}"
+            return f"Failed to fetch news: {status_code}"
     except Exception as e:
         return f"Error occurred while fetching news: {str(e)}"
 
@@ -32,20 +57,17 @@ def get_news_sources() -> str:
     """
     Fetches the sources of the latest news from CryptoPanic.
     """
-    api_key = os.getenv('CRYPTOPANIC_API_KEY')
-    if not api_key:
+    if not API_KEY:
         return "API key for CryptoPanic not found. Please set it in the environment variables."
 
-    url = f'https://cryptopanic.com/api/v1/posts/?auth_token={api_key}&public=true'
     try:
-        response = requests.get(url)
-        if response.status_code == 200:
-            news = response.json()
+        status_code, news = _fetch_news(NEWS_URL)
+        if status_code == 200:
             sources = set(item['domain'] for item in news['results'])
             formatted_sources = [f"{i+1}. {source}" for i, source in enumerate(sources)]
             return '<br>'.join(formatted_sources)
         else:
-            return f"Failed to fetch news sources: {response.status_code}"
+            return f"Failed to fetch news sources: {status_code}"
     except Exception as e:
         return f"Error occurred while fetching news sources: {str(e)}"
 
@@ -54,21 +76,18 @@ def get_last_news_title() -> str:
     """
     Fetches the title of the most recent news from CryptoPanic.
     """
-    api_key = os.getenv('CRYPTOPANIC_API_KEY')
-    if not api_key:
+    if not API_KEY:
         return "API key for CryptoPanic not found. Please set it in the environment variables."
 
-    url = f'https://cryptopanic.com/api/v1/posts/?auth_token={api_key}&public=true'
     try:
-        response = requests.get(url)
-        if response.status_code == 200:
-            news = response.json()
+        status_code, news = _fetch_news(NEWS_URL)
+        if status_code == 200:
             if news['results']:
                 item = news['results'][0]
                 return f"{item['title']} - <a href='{item['url']}'>{item['url']}</a>"
             else:
                 return "No news available"
         else:
-            return f"Failed to fetch the latest news title: {response.status_code}"
+            return f"Failed to fetch the latest news title: {status_code}"
     except Exception as e:
         return f"Error occurred while fetching the latest news title: {str(e)}"
@@ -3,7 +3,35 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from typing import Any, Dict, List, Tuple
-from .utilities import fetch_cryptocurrency_data, fetch_historical_data, calculate_rsi, arima_forecast, calculate_correlation
+from .utilities import fetch_cryptocurrency_data, fetch_historical_data, calculate_rsi, arima_forecast, forecast_dates, calculate_correlation
+
+
+INDICATORS = ['SMA_20', 'SMA_50', 'RSI']
+
+
+def indicator_figure(data: pd.DataFrame, name: str, indicators: List[str], title: str) -> go.Figure:
+    """Plot a price series together with the selected SMA and RSI indicators."""
+    prices = data['Price']
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=data['Date'], y=prices, mode='lines', name=f'{name} Price'))
+
+    if 'SMA_20' in indicators:
+        fig.add_trace(go.Scatter(x=data['Date'], y=prices.rolling(window=20).mean(), mode='lines', name='SMA 20'))
+
+    if 'SMA_50' in indicators:
+        fig.add_trace(go.Scatter(x=data['Date'], y=prices.rolling(window=50).mean(), mode='lines', name='SMA 50'))
+
+    if 'RSI' in indicators:
+        fig.add_trace(go.Scatter(x=data['Date'], y=calculate_rsi(prices, period=14), mode='lines', name='RSI', yaxis='y2'))
+
+    fig.update_layout(
+        title=title,
+        xaxis_title='Date',
+        yaxis_title='Price (USD)',
+        yaxis2=dict(title='RSI', overlaying='y', side='right'),
+        template='plotly_dark'
+    )
+    return fig
 
 
 def register_callbacks(dash_app):
@@ -166,33 +194,13 @@ def register_callbacks(dash_app):
         if data.empty:
             return go.Figure()  # Return an empty figure if no data available
 
-        data["SMA_20"] = data["Price"].rolling(window=20).mean()
-        data["SMA_50"] = data["Price"].rolling(window=50).mean()
-        data["RSI"] = calculate_rsi(data["Price"], period=14)
-
-        fig = go.Figure()
-        fig.add_trace(
-            go.Scatter(x=data["Date"], y=data["Price"], mode="lines", name=f"{crypto.capitalize()} Price")
-        )
-        fig.add_trace(
-            go.Scatter(x=data["Date"], y=data["SMA_20"], mode="lines", name="SMA 20")
-        )
-        fig.add_trace(
-            go.Scatter(x=data["Date"], y=data["SMA_50"], mode="lines", name="SMA 50")
-        )
-        fig.add_trace(
-            go.Scatter(x=data["Date"], y=data["RSI"], mode="lines", name="RSI", yaxis="y2")
+        return indicator_figure(
+            data,
+            crypto.capitalize(),
+            INDICATORS,
+            f"{crypto.capitalize()} Historical Price Analysis with Moving Averages and RSI",
         )
 
-        fig.update_layout(
-            title=f"{crypto.capitalize()} Historical Price Analysis with Moving Averages and RSI",
-            xaxis_title="Date",
-            yaxis_title="Price (USD)",
-            yaxis2=dict(title="RSI", overlaying="y", side="right"),
-            template="plotly_dark",
-        )
-        return fig
-
 
     # Predictive analytics chart using ARIMA forecasting and anomaly detection
     @dash_app.callback(
@@ -205,7 +213,7 @@ def register_callbacks(dash_app):
         forecast_prices = arima_forecast(data['Price'])
         forecast_fig = go.Figure()
         forecast_fig.add_trace(go.Scatter(x=data['Date'], y=data['Price'], mode='lines', name=f'{crypto.capitalize()} Price'))
-        future_dates = pd.date_range(start=data['Date'].iloc[-1], periods=len(forecast_prices) + 1, closed='right').date
+        future_dates = forecast_dates(data['Date'].iloc[-1], len(forecast_prices))
         forecast_fig.add_trace(go.Scatter(x=future_dates, y=forecast_prices, mode='lines', name='ARIMA Forecast'))
         forecast_fig.update_layout(title=f'{crypto.capitalize()} Price Forecast (ARIMA)', xaxis_title='Date', yaxis_title='Price (USD)', template='plotly_dark')
 
@@ -222,30 +230,7 @@ def register_callbacks(dash_app):
     )
     def update_technical_chart(indicators):
         data = fetch_historical_data(['bitcoin'], days=180)['bitcoin']
-        fig = go.Figure()
-
-        fig.add_trace(go.Scatter(x=data['Date'], y=data['Price'], mode='lines', name='Bitcoin Price'))
-
-        if 'SMA_20' in indicators:
-            data['SMA_20'] = data['Price'].rolling(window=20).mean()
-            fig.add_trace(go.Scatter(x=data['Date'], y=data['SMA_20'], mode='lines', name='SMA 20'))
-
-        if 'SMA_50' in indicators:
-            data['SMA_50'] = data['Price'].rolling(window=50).mean()
-            fig.add_trace(go.Scatter(x=data['Date'], y=data['SMA_50'], mode='lines', name='SMA 50'))
-
-        if 'RSI' in indicators:
-            data['RSI'] = calculate_rsi(data['Price'], period=14)
-            fig.add_trace(go.Scatter(x=data['Date'], y=data['RSI'], mode='lines', name='RSI', yaxis='y2'))
-
-        fig.update_layout(
-            title='Bitcoin Price Analysis with Selected Technical Indicators',
-            xaxis_title='Date',
-            yaxis_title='Price (USD)',
-            yaxis2=dict(title='RSI', overlaying='y', side='right'),
-            template='plotly_dark'
-        )
-        return fig
+        return indicator_figure(data, 'Bitcoin', indicators, 'Bitcoin Price Analysis with Selected Technical Indicators')
 
     # Dynamic chart visualization based on selected type
     @dash_app.callback(
@@ -1,5 +1,6 @@
 from flask import Flask
 from dash import Dash, dcc, html, dash_table
+import plotly.io as pio
 from .callbacks import register_callbacks
 # In dashboards/dashboard.py
 from metrics.metrics import rmse, mae, accuracy_score, f1_score
@@ -9,6 +10,9 @@ def create_dashboard(server: Flask) -> Flask:
     """Create a comprehensive cryptocurrency analysis dashboard."""
     dash_app = Dash(server=server, routes_pathname_prefix='/dashboard/')
 
+    # Dash serializes every figure output through plotly.io; orjson is much faster than the stdlib encoder
+    pio.json.config.default_engine = 'orjson'
+
     # Define the layout for the Dash app
     dash_app.layout = html.Div([
         html.H1("CryptoMaster Ultimate Dashboard", style={'textAlign': 'center'}),
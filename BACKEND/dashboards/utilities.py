@@ -1,9 +1,25 @@
 import time
 import requests
+import orjson
 import pandas as pd
 import logging
+import threading
+import numpy as np
+from functools import lru_cache
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from statsmodels.tsa.arima.model import ARIMA
 
+# Keep CoinGecko connections alive across callbacks and retry transient gateway errors.
+# 429s are left to the rate-limit backoff in fetch_cryptocurrency_data.
+session = requests.Session()
+session.mount('https://', HTTPAdapter(
+    pool_maxsize=5,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False),
+))
+
 def fetch_cryptocurrency_data(retries=3, delay=5):
     """Fetch live cryptocurrency data from CoinGecko with retries and delay on rate limit errors."""
     url = ("https://api.coingecko.com/api/v3/simple/price"
@@ -14,7 +30,7 @@ def fetch_cryptocurrency_data(retries=3, delay=5):
            "&include_24hr_change=true")
     
     for attempt in range(retries):
-        response = requests.get(url)
+        response = session.get(url)
         
         # Check for HTTP 429 (Too Many Requests)
         if response.status_code == 429:
@@ -25,7 +41,7 @@ def fetch_cryptocurrency_data(retries=3, delay=5):
         
         # If the request succeeds, parse the data
         if response.ok:
-            data = response.json()
+            data = orjson.loads(response.content)
             return pd.DataFrame([
                 {
                     'Symbol': symbol.capitalize(),
@@ -41,23 +57,56 @@ def fetch_cryptocurrency_data(retries=3, delay=5):
     print("Unable to fetch cryptocurrency data after retries.")
     return pd.DataFrame(columns=['Symbol', 'Price (USD)', 'Volume (24h)', 'Market Cap (USD)', 'Change (24h %)'])
 
+# Shared pool for the blocking per-coin CoinGecko requests
+executor = ThreadPoolExecutor(max_workers=5)
+
+# Every tab re-requests the same coin histories; keep successful responses for five minutes
+history_cache = TTLCache(maxsize=64, ttl=300)
+history_cache_lock = threading.Lock()
+
+def fetch_coin_history(symbol, days=30):
+    """Fetch historical price data for a single cryptocurrency, served from the shared cache when fresh."""
+    key = (symbol, days)
+    with history_cache_lock:
+        prices = history_cache.get(key)
+    if prices is None:
+        prices = _request_coin_history(symbol, days)
+        if prices is None or prices.empty:
+            return prices
+        with history_cache_lock:
+            history_cache[key] = prices
+    # Hand out a copy so callers cannot modify the cached frame
+    return prices.copy()
+
+def _request_coin_history(symbol, days):
+    """Request historical price data for a single cryptocurrency from CoinGecko."""
+    try:
+        url = f"https://api.coingecko.com/api/v3/coins/{symbol}/market_chart?vs_currency=usd&days={days}"
+        response = session.get(url)
+        response.raise_for_status()  # This will raise an exception for non-200 responses
+        data = orjson.loads(response.content)
+        if 'prices' in data:
+            prices = pd.DataFrame(data['prices'], columns=['Timestamp', 'Price'])
+            prices.index = pd.to_datetime(prices['Timestamp'], unit='ms')
+            if days > 1:
+                # CoinGecko returns hourly points for ranges up to 90 days; the charts and models expect one daily close
+                prices = prices.resample('D').last().dropna().astype({'Timestamp': 'int64'})
+            prices['Date'] = prices.index.date
+            return prices.reset_index(drop=True)
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
+        logging.error(f"Failed to fetch historical data for {symbol}: {str(e)}")
+        # Return an empty DataFrame with the same structure to avoid KeyError
+        return pd.DataFrame(columns=['Timestamp', 'Price', 'Date'])
+    return None
+
 def fetch_historical_data(symbols, days=30):
     """Fetch historical price data for a list of cryptocurrencies over a specified number of days."""
     historical_data = {}
-    for symbol in symbols:
-        try:
-            url = f"https://api.coingecko.com/api/v3/coins/{symbol}/market_chart?vs_currency=usd&days={days}"
-            response = requests.get(url)
-            response.raise_for_status()  # This will raise an exception for non-200 responses
-            data = response.json()
-            if 'prices' in data:
-                prices = pd.DataFrame(data['prices'], columns=['Timestamp', 'Price'])
-                prices['Date'] = pd.to_datetime(prices['Timestamp'], unit='ms').dt.date
-                historical_data[symbol] = prices
-        except requests.RequestException as e:
-            logging.error(f"Failed to fetch historical data for {symbol}: {str(e)}")
-            # Return an empty DataFrame with the same structure to avoid KeyError
-            historical_data[symbol] = pd.DataFrame(columns=['Timestamp', 'Price', 'Date'])
+    # Requests are I/O bound, so issue them concurrently instead of one after another
+    results = executor.map(lambda symbol: fetch_coin_history(symbol, days), symbols)
+    for symbol, prices in zip(symbols, results):
+        if prices is not None:
+            historical_data[symbol] = prices
     return historical_data
 
 
@@ -72,12 +121,22 @@ def calculate_rsi(prices, period=14):
     rsi = 100 - (100 / (1 + rs))
     return rsi
 
+@lru_cache(maxsize=64)
+def _fit_arima_forecast(price_bytes, steps):
+    """Fit ARIMA on the raw float64 price buffer and forecast; memoized on the exact values."""
+    model = ARIMA(np.frombuffer(price_bytes, dtype=np.float64), order=(5, 1, 0))
+    model_fit = model.fit()
+    return model_fit.forecast(steps=steps)
+
 def arima_forecast(prices, steps=30):
     """Predict future prices using ARIMA model."""
-    model = ARIMA(prices, order=(5, 1, 0))
-    model_fit = model.fit()
-    forecast = model_fit.forecast(steps=steps)
-    return forecast
+    # Fitting is the slow part of the predictive tab; identical price series reuse the last forecast
+    price_bytes = np.ascontiguousarray(prices, dtype=np.float64).tobytes()
+    return _fit_arima_forecast(price_bytes, steps).copy()
+
+def forecast_dates(last_date, periods):
+    """Return the `periods` calendar days following `last_date` for plotting a forecast."""
+    return np.datetime64(last_date, 'D') + np.arange(1, periods + 1)
 
 def calculate_correlation(cryptos, days=30):
     """Fetch historical data and calculate the correlation between selected cryptocurrencies."""
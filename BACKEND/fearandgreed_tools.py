@@ -1,15 +1,33 @@
+import threading
 import requests
+from cachetools import TTLCache, cachedmethod
+from cachetools.keys import hashkey
 from langchain.tools import tool
 
+def _request_key(parameters):
+    return hashkey(*sorted((name, repr(value)) for name, value in parameters.items()))
+
 class FearAndGreedIndexAPI:
     def __init__(self):
         self.base_url = 'https://api.alternative.me/fng/'
+        self.session = requests.Session()
+        # The index is published once a day, so repeated calls can be served from memory
+        self.cache = TTLCache(maxsize=32, ttl=600)
+        self.cache_lock = threading.Lock()
+
+    @cachedmethod(lambda self: self.cache, key=lambda self, parameters: _request_key(parameters),
+                  lock=lambda self: self.cache_lock)
+    def _fetch(self, parameters):
+        """Fetch the index; HTTP errors raise, so they never reach the cache."""
+        response = self.session.get(self.base_url, params=parameters)
+        response.raise_for_status()
+        return response.json()
 
     def make_request(self, parameters):
         try:
-            response = requests.get(self.base_url, params=parameters)
-            data = response.json()
-            return data
+            return self._fetch(parameters)
+        except requests.exceptions.HTTPError as e:
+            return e.response.json()
         except requests.exceptions.RequestException as e:
             print(f"Error fetching data from Alternative.me: {e}")
             return None
@@ -0,0 +1,18 @@
+import threading
+import requests
+
+
+class RateLimitedSession:
+    """A pooled requests session that caps concurrent requests and always applies a timeout."""
+
+    def __init__(self, max_concurrent: int = 10, timeout: float = 10):
+        self.session = requests.Session()
+        self.slots = threading.BoundedSemaphore(max_concurrent)
+        self.timeout = timeout
+
+    def get(self, url, **kwargs):
+        """Perform a GET while holding one of the request slots."""
+        # Without a timeout a hung connection would hold its slot forever
+        kwargs.setdefault('timeout', self.timeout)
+        with self.slots:
+            return self.session.get(url, **kwargs)
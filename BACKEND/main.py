@@ -27,9 +27,11 @@ socketio = SocketIO(app)
 app = create_dashboard(app)
 
 # Configure structured logging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# LOG_LEVEL=DEBUG turns on request and payload tracing; it is too verbose for production
+log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
+logging.basicConfig(level=log_level, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 handler = RotatingFileHandler('app.log', maxBytes=10000, backupCount=1)
-handler.setLevel(logging.DEBUG)
+handler.setLevel(log_level)
 app.logger.addHandler(handler)
 
 # Import tools before they are used
@@ -50,12 +52,12 @@ def dashboard_page():
 
 @app.before_request
 def log_request():
-    app.logger.debug(f'Incoming request: {request.method} {request.path}')
+    app.logger.debug('Incoming request: %s %s', request.method, request.path)
     session.setdefault('session_id', os.urandom(24).hex())
 
 @app.after_request
 def log_response(response):
-    app.logger.debug(f'Outgoing response: {response.status}')
+    app.logger.debug('Outgoing response: %s', response.status)
     return response
 
 @app.route('/')
@@ -91,7 +93,7 @@ def transcribe_audio():
         
         return jsonify({"transcription": transcription}), 200
     except Exception as e:
-        app.logger.error(f"Error saving audio file: {str(e)}")
+        app.logger.error("Error saving audio file: %s", e)
         return jsonify({"error": str(e)}), 500
 
 
@@ -107,13 +109,13 @@ def upload_document():
         return jsonify({'error': 'No file selected'}), 400
 
     # Log the file details
-    app.logger.debug(f"Received file: {file.filename}, content length: {file.content_length} bytes, mimetype: {file.mimetype}")
+    app.logger.debug("Received file: %s, content length: %s bytes, mimetype: %s", file.filename, file.content_length, file.mimetype)
 
     # Check the actual file content length
     file.seek(0, os.SEEK_END)
     actual_length = file.tell()
     file.seek(0)  # Reset file pointer to the beginning
-    app.logger.debug(f"Actual content length: {actual_length} bytes")
+    app.logger.debug("Actual content length: %s bytes", actual_length)
 
     if actual_length == 0:
         app.logger.debug("File is empty.")
@@ -127,23 +129,23 @@ def upload_document():
         # Ensure the upload directory exists
         if not os.path.exists(app.config['UPLOAD_FOLDER']):
             os.makedirs(app.config['UPLOAD_FOLDER'])
-            app.logger.debug(f"Created upload directory: {app.config['UPLOAD_FOLDER']}")
+            app.logger.debug("Created upload directory: %s", app.config['UPLOAD_FOLDER'])
 
         try:
-            # Log the content of the file before saving
-            file_content = file.read()
-            app.logger.debug(f"File content: {file_content[:100]}...")
-            file.seek(0)  # Reset file pointer to the beginning
+            # Log the content of the file before saving; only read it when debug logging is on
+            if app.logger.isEnabledFor(logging.DEBUG):
+                app.logger.debug("File content: %s...", file.read(100))
+                file.seek(0)  # Reset file pointer to the beginning
 
             file.save(save_path)
-            app.logger.info(f"File saved to {save_path}.")
+            app.logger.info("File saved to %s.", save_path)
             success, message = document_handler.save_document(file)
             if success:
                 return jsonify({'message': message}), 200
             else:
                 return jsonify({'error': message}), 500
         except Exception as e:
-            app.logger.error(f"Error saving file: {str(e)}")
+            app.logger.error("Error saving file: %s", e)
             return jsonify({'error': str(e)}), 500
     else:
         app.logger.debug("Unsupported file type.")
@@ -161,10 +163,10 @@ def handle_query():
             return jsonify({'error': 'Empty query.'}), 400
 
         result = lenox.convchain(query, session['session_id'])
-        app.logger.debug(f"Processed query with convchain, result: {result}")
+        app.logger.debug("Processed query with convchain, result: %s", result)
         return jsonify(result)  # Return the result directly
     except Exception as e:
-        app.logger.error(f"Error processing request: {str(e)}")
+        app.logger.error("Error processing request: %s", e)
         return jsonify({'error': 'Failed to process request.'}), 500
 
 @app.route('/document_query', methods=['POST'])
@@ -176,12 +178,12 @@ def document_query():
             return jsonify({'error': 'Empty query.'}), 400
 
         result = lenox.handle_document_query(query)
-        app.logger.debug(f"Processed document query, result: {result}")
+        app.logger.debug("Processed document query, result: %s", result)
         
         # Ensuring the response is properly formatted as JSON
         return jsonify(result)
     except Exception as e:
-        app.logger.error(f"Error processing document query: {e}")
+        app.logger.error("Error processing document query: %s", e)
         return jsonify({'error': 'Failed to process document query.'}), 500
 
 
@@ -228,9 +230,9 @@ def search():
     query = request.json.get('query')
     if not query:
         return jsonify({'error': 'Empty query.'}), 400
-    app.logger.debug(f"Query received: {query}")
+    app.logger.debug("Query received: %s", query)
     search_results = lenox.web_search_manager.run_search(query)
-    app.logger.debug(f"Search results before formatting: {search_results}")
+    app.logger.debug("Search results before formatting: %s", search_results)
     return jsonify(search_results)
 
 @app.route('/create_visualization', methods=['POST'])
@@ -245,7 +247,7 @@ def create_visualization():
         else:
             return jsonify({"status": "error", "message": visualization_result['content']}), 400
     except Exception as e:
-        app.logger.error(f"Failed to create visualization: {str(e)}")
+        app.logger.error("Failed to create visualization: %s", e)
         return jsonify({'error': 'Failed to process visualization.'}), 500
 
 @socketio.on('connect')
@@ -43,52 +43,3 @@ class RandomForest:
         test_x = np.array(test_x.iloc[:, 1:], dtype=float)
         pred_y = self.model.predict(test_x)
         return pred_y
-    
-
-
-    # Import the model we are using
-from sklearn.ensemble import RandomForestRegressor
-import numpy as np
-import pandas as pd
-
-# Example evaluate_randomforest function implementation
-def evaluate_randomforest():
-    """Evaluate Random Forest model predictions for a dataset."""
-    # Example dataset (replace this with your actual dataset)
-    data = {
-        'features': np.random.random((100, 3)),  # Example features (replace with your actual data)
-        'target': np.random.random(100)         # Example target values
-    }
-
-    # Split the dataset into training and test sets
-    split_index = int(0.8 * len(data['target']))
-    train_features, test_features = data['features'][:split_index], data['features'][split_index:]
-    train_target, test_target = data['target'][:split_index], data['target'][split_index:]
-
-    # Fit the Random Forest model
-    model = RandomForestRegressor(n_estimators=100, random_state=42)
-    model.fit(train_features, train_target)
-
-    # Make predictions
-    predictions = model.predict(test_features)
-
-    return predictions, test_target
-
-class RandomForest:
-
-    def __init__(self, args):
-        self.n_estimators = args.n_estimators
-        self.random_state = args.random_state
-        self.model = RandomForestRegressor(n_estimators=self.n_estimators, random_state=self.random_state)
-
-    def fit(self, data_x):
-        data_x = np.array(data_x)
-        train_x = data_x[:, 1:-1]
-        train_y = data_x[:, -1]
-        self.model.fit(train_x, train_y)
-
-    def predict(self, test_x):
-        test_x = np.array(test_x.iloc[:, 1:], dtype=float)
-        pred_y = self.model.predict(test_x)
-        return pred_y
-
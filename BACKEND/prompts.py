@@ -4,9 +4,6 @@ from collections import deque
 from enum import Enum
 from tool_imports import import_tools
 
-# Initialize logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-
 class IntentType(Enum):
     """Enumeration for identifying the user's intent more effectively."""
     GREETING = "greeting"
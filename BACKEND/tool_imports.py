@@ -1,13 +1,14 @@
 # Continue to import other necessary functions as before
 from reddit_tools import get_reddit_data, count_mentions, analyze_sentiment, find_trending_topics
 from cryptocompare_tools import (
-    get_current_price, get_top_volume_symbols,
+    get_current_price, get_current_prices, get_top_volume_symbols,
     get_latest_social_stats, get_historical_social_stats, list_news_feeds_and_categories,
     get_latest_trading_signals, get_top_exchanges_by_volume
 )
 from coingecko_tools import (
     get_market_data, get_historical_market_data, get_ohlc,
-    get_trending_cryptos, calculate_macd, get_exchange_rates, calculate_rsi
+    get_trending_cryptos, calculate_macd, get_exchange_rates, calculate_rsi,
+    calculate_indicators
 )
 from youtube_tools import search_youtube, process_youtube_video, query_youtube_video
 from coinpaprika_tools import get_coin_details, get_coin_tags, get_market_overview, get_ticker_info
@@ -26,6 +27,7 @@ def import_tools():
     tools = [
         # CryptoCompare Tools
         get_current_price,
+        get_current_prices,
         get_top_volume_symbols,
         get_latest_social_stats,
         get_historical_social_stats,
@@ -41,6 +43,7 @@ def import_tools():
         calculate_macd,
         get_exchange_rates,
         calculate_rsi,
+        calculate_indicators,
 
         # Reddit Tools
         get_reddit_data,
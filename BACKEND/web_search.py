@@ -93,14 +93,14 @@ class WebSearchManager:
             verbose=True,
         )
 
-        logging.basicConfig(level=logging.DEBUG)
         self.logger = logging.getLogger(__name__)
 
     def run_search(self, query: str) -> dict:
         try:
             response = self.agent_chain.run({"input": query})
-            self.logger.debug(f"Raw Tavily response: {response}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Raw Tavily response: %s", response)
             return {"type": "text", "content": response}
         except Exception as e:
-            self.logger.error(f"Error using Tavily: {str(e)}")
+            self.logger.error("Error using Tavily: %s", e)
             return {"type": "text", "content": f"Error using Tavily: {str(e)}"}